@@ -27,12 +27,17 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.28.0",
-        "websocket-client>=1.6.0",
-        "pydantic>=2.0.0",
+        "httpx[http2]>=0.24.0",
+        "websockets>=13.0",
+        "msgspec>=0.18.0",
+        "cachetools>=5.0.0",
         "python-dateutil>=2.8.0",
     ],
     extras_require={
+        "accel": [
+            "numpy>=1.22.0",
+            "numba>=0.57.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -3,9 +3,19 @@ ADX Python SDK
 """
 
 from .client import ADXClient
+from .async_client import AsyncADXClient
 from .types import (
+    ADXStruct,
     BidRequest,
     BidResponse,
+    BidTemplate,
+    SeatBid,
+    Bid,
+    CtvBidRequest,
+    CtvImpression,
+    CtvBidResponse,
+    CtvSeatBid,
+    CtvBid,
     Impression,
     Video,
     Banner,
@@ -14,7 +24,10 @@ from .types import (
     App,
     User,
     AnalyticsResponse,
+    DailyStat,
     MinerConfig,
+    Location,
+    Hardware,
     MinerRegistration,
     MinerEarnings,
     VASTParams
@@ -31,8 +44,18 @@ __version__ = "1.0.0"
 __author__ = "ADX"
 __all__ = [
     "ADXClient",
+    "AsyncADXClient",
+    "ADXStruct",
     "BidRequest",
     "BidResponse",
+    "BidTemplate",
+    "SeatBid",
+    "Bid",
+    "CtvBidRequest",
+    "CtvImpression",
+    "CtvBidResponse",
+    "CtvSeatBid",
+    "CtvBid",
     "Impression",
     "Video",
     "Banner",
@@ -41,7 +64,10 @@ __all__ = [
     "App",
     "User",
     "AnalyticsResponse",
+    "DailyStat",
     "MinerConfig",
+    "Location",
+    "Hardware",
     "MinerRegistration",
     "MinerEarnings",
     "VASTParams",
@@ -0,0 +1,93 @@
+"""
+Accelerated aggregation helpers for ADX SDK
+
+Requires the ``accel`` extra. Numba is used to JIT-compile the hot loops
+when it is installed; otherwise the equivalent NumPy reductions are used.
+"""
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+# Number of quartile buckets: 0 (not started) through 4 (complete)
+QUARTILE_BUCKETS = 5
+
+ArrayLike = Union[np.ndarray, Sequence[float], Sequence[int]]
+
+
+def _aggregate_numpy(
+    views: np.ndarray,
+    quarts: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    hist = np.bincount(quarts, minlength=QUARTILE_BUCKETS).astype(np.int64)
+    return hist, float(views.sum(dtype=np.float64)) / views.shape[0]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _aggregate(views, quarts):
+        # Serial loop: a prange over the histogram would race on hist[q]
+        n = views.shape[0]
+        hist = np.zeros(QUARTILE_BUCKETS, dtype=np.int64)
+        s = 0.0
+        for i in range(n):
+            s += views[i]
+            hist[quarts[i]] += 1
+        return hist, s / n
+else:
+    _aggregate = _aggregate_numpy
+
+
+def aggregate_viewability(
+    views: ArrayLike,
+    quarts: ArrayLike
+) -> Tuple[np.ndarray, float]:
+    """
+    Aggregate viewability across many impressions
+
+    Args:
+        views: Viewability percentage (0-100) per impression
+        quarts: Highest quartile reached per impression (0-4)
+
+    Returns:
+        Tuple of (quartile histogram of length 5, mean viewability)
+    """
+    views = np.ascontiguousarray(views, dtype=np.float32)
+    quarts = np.asarray(quarts)
+
+    if views.shape != quarts.shape or views.ndim != 1:
+        raise ValidationError("views and quarts must be 1-D and equal length")
+
+    if views.shape[0] == 0:
+        return np.zeros(QUARTILE_BUCKETS, dtype=np.int64), 0.0
+
+    # Validate before narrowing to int8: the cast would wrap out-of-range
+    # values and truncate fractions, and the JIT loop indexes the
+    # histogram without bounds checks
+    if quarts.dtype.kind == 'f':
+        if not np.all(quarts == np.trunc(quarts)):
+            raise ValidationError("Quartile values must be integers")
+    elif quarts.dtype.kind not in 'iu':
+        raise ValidationError("Quartile values must be integers")
+
+    if quarts.min() < 0 or quarts.max() >= QUARTILE_BUCKETS:
+        raise ValidationError("Quartile values must be between 0 and 4")
+
+    quarts = np.ascontiguousarray(quarts, dtype=np.int8)
+
+    hist, mean = _aggregate(views, quarts)
+    return hist, float(mean)
+
+
+def warmup() -> None:
+    """
+    Compile (or load from cache) the JIT kernels ahead of first use
+    """
+    aggregate_viewability([0.0], [0])
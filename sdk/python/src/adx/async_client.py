@@ -0,0 +1,969 @@
+"""
+Asynchronous ADX Client implementation for Python SDK
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import logging
+import threading
+from datetime import datetime
+from typing import (
+    Dict, List, Optional, Any, AsyncIterator, Callable, Iterable, Set, Tuple,
+    Union
+)
+
+import httpx
+import msgspec
+from cachetools import TTLCache
+from websockets.asyncio.client import connect as ws_connect
+
+from .types import (
+    BidRequest,
+    BidResponse,
+    BidTemplate,
+    AnalyticsResponse,
+    MinerConfig,
+    MinerRegistration,
+    MinerEarnings,
+    VASTParams
+)
+from .exceptions import (
+    ADXException,
+    AuthenticationError,
+    RateLimitError,
+    ValidationError,
+    NetworkError
+)
+
+logger = logging.getLogger(__name__)
+
+_ENCODER = msgspec.json.Encoder()
+_DECODER = msgspec.json.Decoder()
+_BID_REQ_DEC = msgspec.json.Decoder(BidRequest)
+
+# Leading bytes of an encoded BidRequest with an empty id and imp list
+_BID_TEMPLATE_HEAD = b'{"id":"","imp":[]'
+_ANALYTICS_DEC = msgspec.json.Decoder(AnalyticsResponse)
+_MINER_REG_DEC = msgspec.json.Decoder(MinerRegistration)
+_MINER_EARNINGS_DEC = msgspec.json.Decoder(MinerEarnings)
+
+
+# Upper bound for the WebSocket reconnect backoff, in seconds
+_WS_MAX_BACKOFF = 30
+
+_VALID_MINER_STATUSES = frozenset({'online', 'offline', 'maintenance'})
+
+# Gateway errors that are safe to retry after a short backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+def _decode_bid_request(decoder: msgspec.json.Decoder, body: bytes) -> Any:
+    """Decode an encoded bid request, raising ValidationError if invalid"""
+    try:
+        return decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise ValidationError(f"Invalid bid request: {e}")
+
+
+async def _await(awaitable: Any) -> Any:
+    """Wrap an arbitrary awaitable in a coroutine"""
+    return await awaitable
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that retries transient gateway errors with
+    exponential backoff
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.1
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request
+    ) -> httpx.Response:
+        for attempt in range(self._retries):
+            response = await self._transport.handle_async_request(request)
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+
+            await response.aclose()
+            await asyncio.sleep(self._backoff_factor * (2 ** attempt))
+
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@functools.lru_cache(maxsize=4096)
+def _miner_url(base_url: str, miner_id: str, action: str) -> httpx.URL:
+    """Build (and memoize) a per-miner endpoint URL"""
+    return httpx.URL(f'{base_url}/miner/{miner_id}/{action}')
+
+
+class AsyncADXClient:
+    """
+    Asynchronous client for interacting with the Luxfi ADX API
+    """
+
+    def __init__(self, base_url: str, api_key: str, timeout: int = 10):
+        """
+        Initialize async ADX client
+
+        Args:
+            base_url: Base URL of the ADX API
+            api_key: API key for authentication
+            timeout: Request timeout in seconds
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                'X-API-Key': api_key,
+                'Content-Type': 'application/json',
+                'User-Agent': 'luxfi-adx-python/1.0.0'
+            },
+            timeout=timeout,
+            transport=_RetryTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=128,
+                        max_keepalive_connections=64
+                    ),
+                    retries=3
+                )
+            )
+        )
+
+        # Absolute URLs are passed through by httpx without re-merging
+        self._url_bid = httpx.URL(self.base_url + '/rtb/bid')
+        self._url_vast = httpx.URL(self.base_url + '/vast')
+        self._url_analytics = httpx.URL(self.base_url + '/analytics')
+        self._url_miner_register = httpx.URL(self.base_url + '/miner/register')
+        self._url_ctv_pod = httpx.URL(self.base_url + '/ctv/pod')
+        self._url_impression_batch = httpx.URL(
+            self.base_url + '/impression/batch'
+        )
+
+        self.bind_schema(BidRequest, BidResponse)
+
+        # Read-mostly dashboard data is cached briefly on the client. The
+        # raw response body is cached and decoded per hit, so each caller
+        # gets its own (mutable) struct.
+        self._analytics_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._earnings_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+        self._cache_lock = threading.Lock()
+
+        self.ws = None
+        self.event_handlers: Dict[str, Tuple[Callable[[Any], Any], ...]] = {}
+        self._ws_task: Optional[asyncio.Task] = None
+        self._ws_connected: Optional[asyncio.Event] = None
+        self._ws_running = False
+        self._handler_tasks: Set[asyncio.Future] = set()
+        self._handler_executor: Optional[
+            concurrent.futures.ThreadPoolExecutor
+        ] = None
+
+    def bind_schema(
+        self,
+        bid_request_schema: type,
+        bid_response_schema: type
+    ) -> None:
+        """
+        Use specialized struct types for bid requests and responses
+
+        Decoders built for a narrow schema (e.g. CtvBidRequest and
+        CtvBidResponse) only handle the fields an integration actually
+        uses, which makes validation and decoding cheaper.
+
+        Args:
+            bid_request_schema: Struct type used to validate bid requests
+            bid_response_schema: Struct type bid responses decode into
+        """
+        self._bid_req_type = bid_request_schema
+        self._bid_req_dec = msgspec.json.Decoder(bid_request_schema)
+        self._bid_resp_dec = msgspec.json.Decoder(bid_response_schema)
+
+    async def bid_request(
+        self,
+        request: Union[BidRequest, Dict[str, Any]]
+    ) -> BidResponse:
+        """
+        Send an OpenRTB bid request
+
+        Args:
+            request: OpenRTB bid request or equivalent dictionary
+
+        Returns:
+            OpenRTB bid response, decoded into the bound response schema
+        """
+        if isinstance(request, (BidRequest, self._bid_req_type)):
+            body = _ENCODER.encode(request)
+        else:
+            # Round-trip through the full schema so None values and unknown
+            # keys are dropped; dicts go through JSON so that lazily parsed
+            # (Raw) fields such as ext are captured as encoded bytes
+            body = _ENCODER.encode(
+                _decode_bid_request(_BID_REQ_DEC, _ENCODER.encode(request))
+            )
+
+        # A narrow bound schema only validates: decoding into it would drop
+        # the fields it does not model
+        if not isinstance(request, self._bid_req_type):
+            _decode_bid_request(self._bid_req_dec, body)
+
+        return await self._send_bid(body)
+
+    def precompile_bid_template(self, static: Dict[str, Any]) -> BidTemplate:
+        """
+        Pre-encode the fields shared by many bid requests
+
+        Args:
+            static: Constant bid request fields (e.g. device, app, user);
+                must not contain 'id' or 'imp'
+
+        Returns:
+            Template for bid_request_fast
+        """
+        if 'id' in static or 'imp' in static:
+            raise ValidationError("Bid template must not contain 'id' or 'imp'")
+
+        # Validate the static fields and encode the validated struct, so
+        # None values and unknown keys are dropped as in bid_request
+        body = _ENCODER.encode({**static, 'id': '', 'imp': []})
+        if self._bid_req_type is not BidRequest:
+            _decode_bid_request(self._bid_req_dec, body)
+        encoded = _ENCODER.encode(_decode_bid_request(_BID_REQ_DEC, body))
+
+        # Encoded structs lead with the required id and imp fields; keep
+        # what follows, ending with a comma if anything does
+        fields = encoded[len(_BID_TEMPLATE_HEAD):-1]
+        prefix = b'{' + fields[1:] + b',' if fields else b'{'
+        return BidTemplate(prefix=prefix)
+
+    async def bid_request_fast(
+        self,
+        template: BidTemplate,
+        imp: List[Any],
+        request_id: str
+    ) -> BidResponse:
+        """
+        Send a bid request built from a precompiled template
+
+        Only the impressions and request ID are encoded per call; they are
+        not validated.
+
+        Args:
+            template: Template from precompile_bid_template
+            imp: Impressions, as structs or dictionaries
+            request_id: Bid request ID
+
+        Returns:
+            OpenRTB bid response, decoded into the bound response schema
+        """
+        body = b''.join((
+            template.prefix,
+            b'"imp":',
+            _ENCODER.encode(imp),
+            b',"id":',
+            _ENCODER.encode(request_id),
+            b'}'
+        ))
+        return await self._send_bid(body)
+
+    async def _send_bid(self, body: bytes) -> BidResponse:
+        """
+        Post an encoded bid request and decode the response
+
+        Args:
+            body: JSON-encoded bid request
+
+        Returns:
+            OpenRTB bid response, decoded into the bound response schema
+        """
+        try:
+            response = await self._client.post(self._url_bid, content=body)
+            response.raise_for_status()
+
+            return self._bid_resp_dec.decode(response.content)
+
+        except httpx.TimeoutException:
+            raise NetworkError("Bid request timed out")
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Bid request failed: {str(e)}")
+
+    async def get_vast(self, params: VASTParams) -> str:
+        """
+        Get VAST ad creative
+
+        Args:
+            params: VAST request parameters
+
+        Returns:
+            VAST XML string
+        """
+        try:
+            response = await self._client.get(
+                self._url_vast,
+                params=self._vast_query(params)
+            )
+            response.raise_for_status()
+            # VAST servers send UTF-8; skip charset detection
+            return response.content.decode('utf-8')
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"VAST request failed: {str(e)}")
+
+    async def get_vast_stream(
+        self,
+        params: VASTParams,
+        chunk_size: int = 8192
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a VAST ad creative without buffering the whole document
+
+        Args:
+            params: VAST request parameters
+            chunk_size: Size of yielded chunks in bytes
+
+        Yields:
+            Chunks of the raw VAST XML body
+        """
+        try:
+            async with self._client.stream(
+                'GET',
+                self._url_vast,
+                params=self._vast_query(params)
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"VAST request failed: {str(e)}")
+
+    async def get_analytics(
+        self,
+        publisher_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> AnalyticsResponse:
+        """
+        Get analytics data
+
+        Args:
+            publisher_id: Publisher ID
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            Analytics response
+        """
+        # Integer keys hash faster than ISO strings; format only on a miss
+        key = (
+            publisher_id,
+            int(start_time.timestamp() * 1000),
+            int(end_time.timestamp() * 1000)
+        )
+
+        with self._cache_lock:
+            cached = self._analytics_cache.get(key)
+        if cached is not None:
+            return _ANALYTICS_DEC.decode(cached)
+
+        params = {
+            'publisher_id': publisher_id,
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        }
+
+        try:
+            response = await self._client.get(
+                self._url_analytics,
+                params=params
+            )
+            response.raise_for_status()
+
+            analytics = _ANALYTICS_DEC.decode(response.content)
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Analytics request failed: {str(e)}")
+
+        with self._cache_lock:
+            self._analytics_cache[key] = response.content
+        return analytics
+
+    async def register_miner(
+        self,
+        config: Union[MinerConfig, Dict[str, Any]]
+    ) -> MinerRegistration:
+        """
+        Register a home miner
+
+        Args:
+            config: Miner configuration or equivalent dictionary
+
+        Returns:
+            Miner registration response
+        """
+        if isinstance(config, MinerConfig):
+            miner_config = config
+        else:
+            miner_config = msgspec.convert(config, MinerConfig)
+
+        try:
+            response = await self._client.post(
+                self._url_miner_register,
+                content=_ENCODER.encode(miner_config)
+            )
+            response.raise_for_status()
+
+            return _MINER_REG_DEC.decode(response.content)
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Miner registration failed: {str(e)}")
+
+    async def get_miner_earnings(self, miner_id: str) -> MinerEarnings:
+        """
+        Get miner earnings
+
+        Args:
+            miner_id: Miner ID
+
+        Returns:
+            Miner earnings data
+        """
+        with self._cache_lock:
+            cached = self._earnings_cache.get(miner_id)
+        if cached is not None:
+            return _MINER_EARNINGS_DEC.decode(cached)
+
+        try:
+            response = await self._client.get(
+                _miner_url(self.base_url, miner_id, 'earnings')
+            )
+            response.raise_for_status()
+
+            earnings = _MINER_EARNINGS_DEC.decode(response.content)
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to get miner earnings: {str(e)}")
+
+        with self._cache_lock:
+            self._earnings_cache[miner_id] = response.content
+        return earnings
+
+    def invalidate_analytics(self, publisher_id: str) -> None:
+        """
+        Drop cached analytics for a publisher
+
+        Args:
+            publisher_id: Publisher ID
+        """
+        with self._cache_lock:
+            for key in [k for k in self._analytics_cache if k[0] == publisher_id]:
+                self._analytics_cache.pop(key, None)
+
+    def invalidate_miner_earnings(self, miner_id: str) -> None:
+        """
+        Drop cached earnings for a miner
+
+        Args:
+            miner_id: Miner ID
+        """
+        with self._cache_lock:
+            self._earnings_cache.pop(miner_id, None)
+
+    async def update_miner_status(
+        self,
+        miner_id: str,
+        status: str
+    ) -> None:
+        """
+        Update miner status
+
+        Args:
+            miner_id: Miner ID
+            status: New status (online, offline, maintenance)
+        """
+        if status not in _VALID_MINER_STATUSES:
+            raise ValidationError(f"Invalid status: {status}")
+
+        try:
+            response = await self._client.put(
+                _miner_url(self.base_url, miner_id, 'status'),
+                content=_ENCODER.encode({'status': status})
+            )
+            response.raise_for_status()
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to update miner status: {str(e)}")
+
+    async def get_ad_pod(
+        self,
+        slot_id: str,
+        duration: int,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get ad pod for CTV
+
+        Args:
+            slot_id: Slot ID
+            duration: Pod duration in seconds
+            context: Additional context
+
+        Returns:
+            Ad pod data
+        """
+        payload = {
+            'slot_id': slot_id,
+            'duration': duration,
+            'context': context or {}
+        }
+
+        try:
+            response = await self._client.post(
+                self._url_ctv_pod,
+                content=_ENCODER.encode(payload)
+            )
+            response.raise_for_status()
+            return _DECODER.decode(response.content)
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to get ad pod: {str(e)}")
+
+    async def report_impression(
+        self,
+        impression_id: str,
+        data: Dict[str, Any]
+    ) -> None:
+        """
+        Report impression
+
+        Args:
+            impression_id: Impression ID
+            data: Impression data
+        """
+        try:
+            response = await self._client.post(
+                f'{self.base_url}/impression/{impression_id}',
+                content=_ENCODER.encode(data)
+            )
+            response.raise_for_status()
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to report impression: {str(e)}")
+
+    async def report_impressions_bulk(
+        self,
+        impressions: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Report many impressions concurrently
+
+        Args:
+            impressions: List of (impression ID, impression data) pairs
+        """
+        await self.map('report_impression', impressions)
+
+    async def map(
+        self,
+        method: str,
+        calls: Iterable[Tuple[Any, ...]],
+        concurrency: int = 32
+    ) -> List[Any]:
+        """
+        Call a client method concurrently for many argument tuples
+
+        Args:
+            method: Name of the client method, e.g. 'report_impression'
+            calls: Positional argument tuples, one per call
+            concurrency: Maximum number of calls in flight at once
+
+        Returns:
+            Results in the same order as calls
+
+        Raises:
+            ValidationError: If method is not a public coroutine method or
+                concurrency is less than 1
+        """
+        func = getattr(self, method, None)
+        if method.startswith('_') or not inspect.iscoroutinefunction(func):
+            raise ValidationError(f"Not a client request method: {method}")
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(args: Tuple[Any, ...]) -> Any:
+            async with semaphore:
+                return await func(*args)
+
+        return await asyncio.gather(*[call(args) for args in calls])
+
+    async def report_impressions_batch(
+        self,
+        impressions: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Report many impressions in a single request
+
+        Args:
+            impressions: List of (impression ID, impression data) pairs
+        """
+        payload = [
+            {'impression_id': impression_id, 'data': data}
+            for impression_id, data in impressions
+        ]
+
+        try:
+            response = await self._client.post(
+                self._url_impression_batch,
+                content=_ENCODER.encode(payload)
+            )
+            response.raise_for_status()
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to report impressions: {str(e)}")
+
+    async def report_viewability(
+        self,
+        impression_id: str,
+        viewability: float,
+        quartiles: List[int]
+    ) -> None:
+        """
+        Report viewability metrics
+
+        Args:
+            impression_id: Impression ID
+            viewability: Viewability percentage (0-100)
+            quartiles: Quartile completion markers
+        """
+        payload = {
+            'viewability': viewability,
+            'quartiles': quartiles
+        }
+
+        try:
+            response = await self._client.post(
+                f'{self.base_url}/viewability/{impression_id}',
+                content=_ENCODER.encode(payload)
+            )
+            response.raise_for_status()
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+        except Exception as e:
+            raise NetworkError(f"Failed to report viewability: {str(e)}")
+
+    async def connect_websocket(self) -> None:
+        """
+        Connect to WebSocket for real-time updates
+
+        The connection is maintained in the background and re-established
+        with exponential backoff if it drops.
+        """
+        if self._ws_task is not None:
+            return
+
+        self._ws_running = True
+        self._ws_connected = asyncio.Event()
+        self._ws_task = asyncio.create_task(self._ws_loop())
+
+        try:
+            await asyncio.wait_for(self._ws_connected.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            await self.close_websocket()
+            raise NetworkError("WebSocket connection timed out")
+
+    async def subscribe(self, events: List[str]) -> None:
+        """
+        Subscribe to WebSocket events
+
+        Args:
+            events: List of event types to subscribe to
+        """
+        if not self.ws:
+            raise ADXException("WebSocket not connected")
+
+        message = {
+            'type': 'subscribe',
+            'events': events
+        }
+
+        await self.ws.send(_ENCODER.encode(message).decode())
+
+    def on(self, event: str, handler: Callable[[Any], Any]) -> None:
+        """
+        Register event handler
+
+        Handlers may be plain functions or coroutine functions. Coroutine
+        handlers are scheduled as tasks on the event loop; plain handlers
+        run in order on a dedicated handler thread, so they may block or
+        call back into a synchronous ADXClient.
+
+        Args:
+            event: Event type
+            handler: Event handler function
+        """
+        # Handlers are stored as immutable tuples that are replaced on
+        # change, so dispatch never observes a partially updated list
+        self.event_handlers[event] = self.event_handlers.get(event, ()) + (handler,)
+
+    def off(self, event: str, handler: Callable[[Any], Any]) -> None:
+        """
+        Remove event handler
+
+        Args:
+            event: Event type
+            handler: Event handler function
+        """
+        handlers = self.event_handlers.get(event)
+        if handlers and handler in handlers:
+            index = handlers.index(handler)
+            self.event_handlers[event] = handlers[:index] + handlers[index + 1:]
+
+    async def close_websocket(self) -> None:
+        """
+        Close the WebSocket connection and stop reconnecting
+        """
+        self._ws_running = False
+
+        if self.ws is not None:
+            await self.ws.close()
+
+        if self._ws_task is not None:
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
+
+    async def aclose(self) -> None:
+        """
+        Close client connections
+        """
+        await self.close_websocket()
+        await self._client.aclose()
+
+        if self._handler_executor is not None:
+            self._handler_executor.shutdown(wait=False)
+            self._handler_executor = None
+
+    async def _ws_loop(self) -> None:
+        """
+        Receive WebSocket messages, reconnecting on disconnection
+        """
+        ws_url = self.base_url.replace('http', 'ws') + '/ws'
+        attempt = 0
+
+        while self._ws_running:
+            try:
+                async with ws_connect(
+                    ws_url,
+                    additional_headers=[('X-API-Key', self.api_key)]
+                ) as ws:
+                    self.ws = ws
+                    attempt = 0
+                    self._ws_connected.set()
+                    logger.info("WebSocket connected")
+
+                    async for message in ws:
+                        # A bad frame must never drop the connection
+                        try:
+                            self._dispatch(message)
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to dispatch WebSocket message: {e}"
+                            )
+
+                    logger.info(
+                        f"WebSocket closed: {ws.close_code} - {ws.close_reason}"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket error: {e}")
+            finally:
+                self.ws = None
+                self._ws_connected.clear()
+
+            if not self._ws_running:
+                break
+
+            delay = min(2 ** attempt, _WS_MAX_BACKOFF)
+            attempt += 1
+            logger.info(f"Attempting to reconnect WebSocket in {delay}s...")
+            await asyncio.sleep(delay)
+
+    def _dispatch(self, message: Union[str, bytes]) -> None:
+        """
+        Dispatch a WebSocket message to registered handlers
+
+        Args:
+            message: Raw WebSocket frame
+        """
+        try:
+            data = _DECODER.decode(message)
+        except msgspec.DecodeError:
+            logger.error(f"Failed to parse WebSocket message: {message}")
+            return
+
+        if not isinstance(data, dict) or not isinstance(data.get('type'), str):
+            logger.error(f"Dropping malformed WebSocket message: {message}")
+            return
+
+        payload = data.get('data')
+
+        for handler in self.event_handlers.get(data['type'], ()):
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    future = asyncio.ensure_future(handler(payload))
+                else:
+                    loop = asyncio.get_running_loop()
+                    future = loop.run_in_executor(
+                        self._get_handler_executor(),
+                        self._call_handler,
+                        handler,
+                        payload,
+                        loop
+                    )
+                self._handler_tasks.add(future)
+                future.add_done_callback(self._handler_done)
+            except Exception as e:
+                logger.error(f"Error in event handler: {e}")
+
+    def _call_handler(
+        self,
+        handler: Callable,
+        payload: Any,
+        loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """
+        Run a plain event handler on the handler thread
+
+        Callables that are not coroutine functions but still return an
+        awaitable (e.g. objects with an async __call__) have the awaitable
+        scheduled on the event loop.
+
+        Args:
+            handler: Event handler
+            payload: Event data
+            loop: Event loop the client runs on
+        """
+        result = handler(payload)
+        if inspect.isawaitable(result):
+            future = asyncio.run_coroutine_threadsafe(_await(result), loop)
+            future.add_done_callback(self._handler_done)
+
+    def _get_handler_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Lazily create the single thread that runs plain event handlers
+
+        A single worker keeps handlers in message order, as the previous
+        dedicated WebSocket thread did.
+        """
+        if self._handler_executor is None:
+            self._handler_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='adx-ws-handler'
+            )
+        return self._handler_executor
+
+    def _handler_done(self, task: asyncio.Future) -> None:
+        """
+        Reap a finished event handler, logging any failure
+
+        Args:
+            task: Completed handler task or executor future
+        """
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in event handler: {task.exception()}")
+
+    def _vast_query(self, params: VASTParams) -> Dict[str, Any]:
+        """
+        Build VAST query parameters
+
+        Args:
+            params: VAST request parameters
+
+        Returns:
+            Query parameter dictionary
+        """
+        query_params = {
+            'w': params.width,
+            'h': params.height,
+            'dur': params.duration
+        }
+
+        if params.extra:
+            query_params.update(params.extra)
+
+        return query_params
+
+    def _handle_http_error(self, error: httpx.HTTPStatusError) -> None:
+        """
+        Handle HTTP errors
+
+        Args:
+            error: HTTP error
+        """
+        status_code = error.response.status_code
+
+        if status_code == 401:
+            raise AuthenticationError("Invalid API key")
+        elif status_code == 429:
+            raise RateLimitError("Rate limit exceeded")
+        elif status_code == 400:
+            raise ValidationError(f"Invalid request: {error.response.text}")
+        else:
+            raise ADXException(f"HTTP {status_code}: {error.response.text}")
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
@@ -2,43 +2,55 @@
 ADX Client implementation for Python SDK
 """
 
-import json
+import asyncio
+import concurrent.futures
 import logging
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
-from urllib.parse import urljoin, urlparse
-
-import requests
-import websocket
-from pydantic import BaseModel
+from typing import (
+    Dict, List, Optional, Any, AsyncIterator, Callable, Coroutine, Iterable,
+    Iterator, Set, Tuple, TypeVar, Union
+)
 
+from .async_client import AsyncADXClient
 from .types import (
     BidRequest,
     BidResponse,
+    BidTemplate,
     AnalyticsResponse,
     MinerConfig,
     MinerRegistration,
     MinerEarnings,
     VASTParams
 )
-from .exceptions import (
-    ADXException,
-    AuthenticationError,
-    RateLimitError,
-    ValidationError,
-    NetworkError
-)
+from .exceptions import ADXException
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Auto-batching limits for report_impression
+_IMPRESSION_BATCH_SIZE = 128
+_IMPRESSION_FLUSH_INTERVAL = 0.05
+
+
+async def _anext(iterator: AsyncIterator[T]) -> T:
+    """Await the next item of an async iterator as a plain coroutine"""
+    return await iterator.__anext__()
+
 
 class ADXClient:
     """
     Client for interacting with the Luxfi ADX API
     """
     
-    def __init__(self, base_url: str, api_key: str, timeout: int = 10):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 10,
+        batch_impressions: bool = False
+    ):
         """
         Initialize ADX client
         
@@ -46,54 +58,87 @@ class ADXClient:
             base_url: Base URL of the ADX API
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            batch_impressions: Buffer report_impression calls and send them
+                in batches of up to 128 or every 50ms
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-API-Key': api_key,
-            'Content-Type': 'application/json',
-            'User-Agent': 'luxfi-adx-python/1.0.0'
-        })
+        self.batch_impressions = batch_impressions
+        self._async = AsyncADXClient(base_url, api_key, timeout)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
+        self._imp_buffer: List[Tuple[str, Dict[str, Any]]] = []
+        self._imp_lock = threading.Lock()
+        self._imp_flush_pending = False
+        self._imp_inflight: Set[concurrent.futures.Future] = set()
+        
+        self.event_handlers = self._async.event_handlers
+    
+    def bind_schema(
+        self,
+        bid_request_schema: type,
+        bid_response_schema: type
+    ) -> None:
+        """
+        Use specialized struct types for bid requests and responses
         
-        self.ws = None
-        self.ws_thread = None
-        self.event_handlers = {}
-        self._ws_running = False
+        Args:
+            bid_request_schema: Struct type used to validate bid requests
+            bid_response_schema: Struct type bid responses decode into
+        """
+        self._async.bind_schema(bid_request_schema, bid_response_schema)
     
-    def bid_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def bid_request(
+        self,
+        request: Union[BidRequest, Dict[str, Any]]
+    ) -> BidResponse:
         """
         Send an OpenRTB bid request
         
         Args:
-            request: OpenRTB bid request dictionary
+            request: OpenRTB bid request or equivalent dictionary
             
         Returns:
-            OpenRTB bid response dictionary
+            OpenRTB bid response, decoded into the bound response schema
         """
-        # Validate request
-        bid_req = BidRequest.model_validate(request)
-        
-        url = urljoin(self.base_url, '/rtb/bid')
+        return self._run(self._async.bid_request(request))
+    
+    def precompile_bid_template(self, static: Dict[str, Any]) -> BidTemplate:
+        """
+        Pre-encode the fields shared by many bid requests
         
-        try:
-            response = self.session.post(
-                url,
-                json=bid_req.model_dump(exclude_none=True),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+        Args:
+            static: Constant bid request fields (e.g. device, app, user);
+                must not contain 'id' or 'imp'
             
-            bid_resp = BidResponse.model_validate(response.json())
-            return bid_resp.model_dump()
+        Returns:
+            Template for bid_request_fast
+        """
+        return self._async.precompile_bid_template(static)
+    
+    def bid_request_fast(
+        self,
+        template: BidTemplate,
+        imp: List[Any],
+        request_id: str
+    ) -> BidResponse:
+        """
+        Send a bid request built from a precompiled template
+        
+        Args:
+            template: Template from precompile_bid_template
+            imp: Impressions, as structs or dictionaries
+            request_id: Bid request ID
             
-        except requests.exceptions.Timeout:
-            raise NetworkError("Bid request timed out")
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Bid request failed: {str(e)}")
+        Returns:
+            OpenRTB bid response, decoded into the bound response schema
+        """
+        return self._run(
+            self._async.bid_request_fast(template, imp, request_id)
+        )
     
     def get_vast(self, params: VASTParams) -> str:
         """
@@ -105,37 +150,39 @@ class ADXClient:
         Returns:
             VAST XML string
         """
-        url = urljoin(self.base_url, '/vast')
-        
-        query_params = {
-            'w': params.width,
-            'h': params.height,
-            'dur': params.duration
-        }
-        
-        if params.extra:
-            query_params.update(params.extra)
+        return self._run(self._async.get_vast(params))
+    
+    def get_vast_stream(
+        self,
+        params: VASTParams,
+        chunk_size: int = 8192
+    ) -> Iterator[bytes]:
+        """
+        Stream a VAST ad creative without buffering the whole document
         
-        try:
-            response = self.session.get(
-                url,
-                params=query_params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.text
+        Args:
+            params: VAST request parameters
+            chunk_size: Size of yielded chunks in bytes
             
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"VAST request failed: {str(e)}")
+        Yields:
+            Chunks of the raw VAST XML body
+        """
+        chunks = self._async.get_vast_stream(params, chunk_size)
+        try:
+            while True:
+                try:
+                    yield self._run(_anext(chunks))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(chunks.aclose())
     
     def get_analytics(
         self,
         publisher_id: str,
         start_time: datetime,
         end_time: datetime
-    ) -> Dict[str, Any]:
+    ) -> AnalyticsResponse:
         """
         Get analytics data
         
@@ -145,63 +192,28 @@ class ADXClient:
             end_time: End of time range
             
         Returns:
-            Analytics response dictionary
+            Analytics response
         """
-        url = urljoin(self.base_url, '/analytics')
-        
-        params = {
-            'publisher_id': publisher_id,
-            'start': start_time.isoformat(),
-            'end': end_time.isoformat()
-        }
-        
-        try:
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            analytics = AnalyticsResponse.model_validate(response.json())
-            return analytics.model_dump()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Analytics request failed: {str(e)}")
+        return self._run(
+            self._async.get_analytics(publisher_id, start_time, end_time)
+        )
     
-    def register_miner(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def register_miner(
+        self,
+        config: Union[MinerConfig, Dict[str, Any]]
+    ) -> MinerRegistration:
         """
         Register a home miner
         
         Args:
-            config: Miner configuration dictionary
+            config: Miner configuration or equivalent dictionary
             
         Returns:
             Miner registration response
         """
-        miner_config = MinerConfig.model_validate(config)
-        
-        url = urljoin(self.base_url, '/miner/register')
-        
-        try:
-            response = self.session.post(
-                url,
-                json=miner_config.model_dump(),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            registration = MinerRegistration.model_validate(response.json())
-            return registration.model_dump()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Miner registration failed: {str(e)}")
+        return self._run(self._async.register_miner(config))
     
-    def get_miner_earnings(self, miner_id: str) -> Dict[str, Any]:
+    def get_miner_earnings(self, miner_id: str) -> MinerEarnings:
         """
         Get miner earnings
         
@@ -211,19 +223,25 @@ class ADXClient:
         Returns:
             Miner earnings data
         """
-        url = urljoin(self.base_url, f'/miner/{miner_id}/earnings')
+        return self._run(self._async.get_miner_earnings(miner_id))
+    
+    def invalidate_analytics(self, publisher_id: str) -> None:
+        """
+        Drop cached analytics for a publisher
         
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            earnings = MinerEarnings.model_validate(response.json())
-            return earnings.model_dump()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Failed to get miner earnings: {str(e)}")
+        Args:
+            publisher_id: Publisher ID
+        """
+        self._async.invalidate_analytics(publisher_id)
+    
+    def invalidate_miner_earnings(self, miner_id: str) -> None:
+        """
+        Drop cached earnings for a miner
+        
+        Args:
+            miner_id: Miner ID
+        """
+        self._async.invalidate_miner_earnings(miner_id)
     
     def update_miner_status(
         self,
@@ -237,23 +255,7 @@ class ADXClient:
             miner_id: Miner ID
             status: New status (online, offline, maintenance)
         """
-        if status not in ['online', 'offline', 'maintenance']:
-            raise ValidationError(f"Invalid status: {status}")
-        
-        url = urljoin(self.base_url, f'/miner/{miner_id}/status')
-        
-        try:
-            response = self.session.put(
-                url,
-                json={'status': status},
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Failed to update miner status: {str(e)}")
+        self._run(self._async.update_miner_status(miner_id, status))
     
     def get_ad_pod(
         self,
@@ -272,27 +274,7 @@ class ADXClient:
         Returns:
             Ad pod data
         """
-        url = urljoin(self.base_url, '/ctv/pod')
-        
-        payload = {
-            'slot_id': slot_id,
-            'duration': duration,
-            'context': context or {}
-        }
-        
-        try:
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Failed to get ad pod: {str(e)}")
+        return self._run(self._async.get_ad_pod(slot_id, duration, context))
     
     def report_impression(
         self,
@@ -306,20 +288,86 @@ class ADXClient:
             impression_id: Impression ID
             data: Impression data
         """
-        url = urljoin(self.base_url, f'/impression/{impression_id}')
+        if not self.batch_impressions:
+            self._run(self._async.report_impression(impression_id, data))
+            return
+        
+        with self._imp_lock:
+            self._imp_buffer.append((impression_id, data))
+            if len(self._imp_buffer) >= _IMPRESSION_BATCH_SIZE:
+                batch, self._imp_buffer = self._imp_buffer, []
+                schedule_flush = False
+            else:
+                batch = None
+                schedule_flush = not self._imp_flush_pending
+                self._imp_flush_pending = True
+        
+        if batch:
+            self._submit_impressions(self._send_impressions(batch))
+        elif schedule_flush:
+            self._submit_impressions(self._flush_impressions_later())
+    
+    def map(
+        self,
+        method: str,
+        calls: Iterable[Tuple[Any, ...]],
+        concurrency: int = 32
+    ) -> List[Any]:
+        """
+        Call a client method concurrently for many argument tuples
         
-        try:
-            response = self.session.post(
-                url,
-                json=data,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+        Calls share the client's event loop and connection pool, so no
+        worker threads are needed. Methods are those of AsyncADXClient:
+        'report_impression' posts each impression individually even when
+        batch_impressions is enabled.
+        
+        Args:
+            method: Name of the client method, e.g. 'report_impression'
+            calls: Positional argument tuples, one per call
+            concurrency: Maximum number of calls in flight at once
+            
+        Returns:
+            Results in the same order as calls
             
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Failed to report impression: {str(e)}")
+        Raises:
+            ValidationError: If method is not a public coroutine method or
+                concurrency is less than 1
+        """
+        return self._run(self._async.map(method, calls, concurrency))
+    
+    def report_impressions_batch(
+        self,
+        impressions: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Report many impressions in a single request
+        
+        Args:
+            impressions: List of (impression ID, impression data) pairs
+        """
+        self._run(self._async.report_impressions_batch(impressions))
+    
+    def flush_impressions(self) -> None:
+        """
+        Send any buffered impressions and wait for in-flight batches
+        """
+        batch = self._take_impressions()
+        if batch:
+            self.report_impressions_batch(batch)
+        
+        concurrent.futures.wait(list(self._imp_inflight))
+    
+    def report_impressions_bulk(
+        self,
+        impressions: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Report many impressions concurrently
+        
+        Args:
+            impressions: List of (impression ID, impression data) pairs
+        """
+        self._run(self._async.report_impressions_bulk(impressions))
     
     def report_viewability(
         self,
@@ -335,72 +383,18 @@ class ADXClient:
             viewability: Viewability percentage (0-100)
             quartiles: Quartile completion markers
         """
-        url = urljoin(self.base_url, f'/viewability/{impression_id}')
-        
-        payload = {
-            'viewability': viewability,
-            'quartiles': quartiles
-        }
-        
-        try:
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-        except requests.exceptions.HTTPError as e:
-            self._handle_http_error(e)
-        except Exception as e:
-            raise NetworkError(f"Failed to report viewability: {str(e)}")
+        self._run(
+            self._async.report_viewability(impression_id, viewability, quartiles)
+        )
     
     def connect_websocket(self) -> None:
         """
         Connect to WebSocket for real-time updates
-        """
-        ws_url = self.base_url.replace('http', 'ws') + '/ws'
-        
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                event_type = data.get('type')
-                
-                if event_type in self.event_handlers:
-                    for handler in self.event_handlers[event_type]:
-                        try:
-                            handler(data.get('data'))
-                        except Exception as e:
-                            logger.error(f"Error in event handler: {e}")
-            except json.JSONDecodeError:
-                logger.error(f"Failed to parse WebSocket message: {message}")
-        
-        def on_error(ws, error):
-            logger.error(f"WebSocket error: {error}")
-        
-        def on_close(ws, close_status_code, close_msg):
-            logger.info(f"WebSocket closed: {close_status_code} - {close_msg}")
-            if self._ws_running:
-                self._reconnect_websocket()
-        
-        def on_open(ws):
-            logger.info("WebSocket connected")
-        
-        self.ws = websocket.WebSocketApp(
-            ws_url,
-            header={'X-API-Key': self.api_key},
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open
-        )
         
-        self._ws_running = True
-        self.ws_thread = threading.Thread(
-            target=self.ws.run_forever,
-            daemon=True
-        )
-        self.ws_thread.start()
+        Plain event handlers run in order on a dedicated handler thread and
+        may call other ADXClient methods.
+        """
+        self._run(self._async.connect_websocket())
     
     def subscribe(self, events: List[str]) -> None:
         """
@@ -409,17 +403,9 @@ class ADXClient:
         Args:
             events: List of event types to subscribe to
         """
-        if not self.ws:
-            raise ADXException("WebSocket not connected")
-        
-        message = {
-            'type': 'subscribe',
-            'events': events
-        }
-        
-        self.ws.send(json.dumps(message))
+        self._run(self._async.subscribe(events))
     
-    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+    def on(self, event: str, handler: Callable[[Any], Any]) -> None:
         """
         Register event handler
         
@@ -427,11 +413,9 @@ class ADXClient:
             event: Event type
             handler: Event handler function
         """
-        if event not in self.event_handlers:
-            self.event_handlers[event] = []
-        self.event_handlers[event].append(handler)
+        self._async.on(event, handler)
     
-    def off(self, event: str, handler: Callable[[Any], None]) -> None:
+    def off(self, event: str, handler: Callable[[Any], Any]) -> None:
         """
         Remove event handler
         
@@ -439,57 +423,108 @@ class ADXClient:
             event: Event type
             handler: Event handler function
         """
-        if event in self.event_handlers:
-            try:
-                self.event_handlers[event].remove(handler)
-            except ValueError:
-                pass
+        self._async.off(event, handler)
     
     def close(self) -> None:
         """
         Close client connections
         """
-        self._ws_running = False
-        
-        if self.ws:
-            self.ws.close()
-            self.ws = None
+        try:
+            self.flush_impressions()
+        except ADXException as e:
+            logger.error(f"Failed to flush impressions on close: {e}")
+        
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            loop_thread, self._loop_thread = self._loop_thread, None
+        
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._async.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join(timeout=5)
+            loop.close()
+    
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the background event loop and wait for its result
         
-        if self.ws_thread:
-            self.ws_thread.join(timeout=5)
-            self.ws_thread = None
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+        """
+        if threading.current_thread() is self._loop_thread:
+            # Blocking here would stop the loop that has to run the coroutine
+            coro.close()
+            raise ADXException(
+                "ADXClient methods cannot be called from its event loop "
+                "thread; await the AsyncADXClient method instead"
+            )
         
-        self.session.close()
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
     
-    def _handle_http_error(self, error: requests.exceptions.HTTPError) -> None:
+    def _submit_impressions(self, coro: Coroutine[Any, Any, None]) -> None:
         """
-        Handle HTTP errors
+        Schedule a background coroutine without waiting for it
         
         Args:
-            error: HTTP error
+            coro: Coroutine to schedule
         """
-        status_code = error.response.status_code
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        self._imp_inflight.add(future)
+        future.add_done_callback(self._imp_inflight.discard)
+    
+    def _take_impressions(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Swap out the impression buffer
         
-        if status_code == 401:
-            raise AuthenticationError("Invalid API key")
-        elif status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
-        elif status_code == 400:
-            raise ValidationError(f"Invalid request: {error.response.text}")
-        else:
-            raise ADXException(f"HTTP {status_code}: {error.response.text}")
+        Returns:
+            Buffered (impression ID, impression data) pairs
+        """
+        with self._imp_lock:
+            batch, self._imp_buffer = self._imp_buffer, []
+            self._imp_flush_pending = False
+        return batch
     
-    def _reconnect_websocket(self) -> None:
+    async def _flush_impressions_later(self) -> None:
         """
-        Reconnect WebSocket after disconnection
+        Flush the impression buffer after the batching window elapses
         """
-        logger.info("Attempting to reconnect WebSocket...")
-        
-        import time
-        time.sleep(5)
+        await asyncio.sleep(_IMPRESSION_FLUSH_INTERVAL)
+        batch = self._take_impressions()
+        if batch:
+            await self._send_impressions(batch)
+    
+    async def _send_impressions(
+        self,
+        batch: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Send a batch of impressions in the background, logging failures
         
-        if self._ws_running:
-            self.connect_websocket()
+        Args:
+            batch: (impression ID, impression data) pairs
+        """
+        try:
+            await self._async.report_impressions_batch(batch)
+        except ADXException as e:
+            logger.error(f"Failed to report {len(batch)} impressions: {e}")
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Lazily start the background event loop used for HTTP calls
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='adx-event-loop',
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
     
     def __enter__(self):
         """Context manager entry"""
@@ -5,24 +5,24 @@ Exception definitions for ADX SDK
 
 class ADXException(Exception):
     """Base exception for ADX SDK"""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(ADXException):
     """Raised when authentication fails"""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(ADXException):
     """Raised when rate limit is exceeded"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(ADXException):
     """Raised when validation fails"""
-    pass
+    __slots__ = ()
 
 
 class NetworkError(ADXException):
     """Raised when network operation fails"""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -2,15 +2,51 @@
 Type definitions for ADX SDK
 """
 
-from datetime import datetime
 from typing import Dict, List, Optional, Any
-from decimal import Decimal
-from pydantic import BaseModel, Field
+
+import msgspec
+
+
+# Default for lazily parsed fields; empty Raw values are omitted on encode.
+# Decoded structs hold the undecoded JSON as msgspec.Raw. Structs built in
+# Python may pass plain dicts/lists instead; both encode the same way.
+_EMPTY_RAW = msgspec.Raw()
+
+
+def _parse_lazy(value: Any, field_type: Any, default: Any) -> Any:
+    """Decode a lazily parsed field, treating unset and null as default"""
+    if isinstance(value, msgspec.Raw):
+        if not value:
+            return default
+        value = msgspec.json.decode(value, type=Optional[field_type])
+    elif value is not None:
+        value = msgspec.convert(value, field_type)
+    return default if value is None else value
+
+
+def _encode_raw(obj: Any) -> Any:
+    """to_builtins hook that expands lazily parsed Raw fields"""
+    if isinstance(obj, msgspec.Raw):
+        return msgspec.json.decode(obj)
+    raise NotImplementedError(f"Cannot convert {type(obj).__name__}")
+
+
+class ADXStruct(msgspec.Struct, omit_defaults=True):
+    """
+    Base type for all ADX SDK structs
+
+    Fields left at their default (None or empty Raw) are omitted when
+    encoded, so no separate exclude-None pass is needed.
+    """
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary keyed by wire field names"""
+        return msgspec.to_builtins(self, enc_hook=_encode_raw)
 
 
 # OpenRTB Types
 
-class Banner(BaseModel):
+class Banner(ADXStruct):
     w: Optional[int] = None
     h: Optional[int] = None
     wmin: Optional[int] = None
@@ -18,11 +54,19 @@ class Banner(BaseModel):
     wmax: Optional[int] = None
     hmax: Optional[int] = None
     pos: Optional[int] = None
-    format: Optional[List[Dict[str, int]]] = None
-    ext: Optional[Dict[str, Any]] = None
+    format: msgspec.Raw = _EMPTY_RAW
+    ext: msgspec.Raw = _EMPTY_RAW
+
+    def parsed_format(self) -> List[Dict[str, int]]:
+        """Decode the lazily parsed format list"""
+        return _parse_lazy(self.format, List[Dict[str, int]], [])
 
+    def parsed_ext(self) -> Dict[str, Any]:
+        """Decode the lazily parsed ext object"""
+        return _parse_lazy(self.ext, Dict[str, Any], {})
 
-class Video(BaseModel):
+
+class Video(ADXStruct):
     mimes: List[str]
     minduration: Optional[int] = None
     maxduration: Optional[int] = None
@@ -40,14 +84,14 @@ class Video(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Native(BaseModel):
+class Native(ADXStruct):
     request: str
     ver: Optional[str] = None
     api: Optional[List[int]] = None
     ext: Optional[Dict[str, Any]] = None
 
 
-class Impression(BaseModel):
+class Impression(ADXStruct):
     id: str
     banner: Optional[Banner] = None
     video: Optional[Video] = None
@@ -55,10 +99,14 @@ class Impression(BaseModel):
     bidfloor: Optional[float] = None
     bidfloorcur: Optional[str] = None
     secure: Optional[int] = None
-    ext: Optional[Dict[str, Any]] = None
+    ext: msgspec.Raw = _EMPTY_RAW
 
+    def parsed_ext(self) -> Dict[str, Any]:
+        """Decode the lazily parsed ext object"""
+        return _parse_lazy(self.ext, Dict[str, Any], {})
 
-class Publisher(BaseModel):
+
+class Publisher(ADXStruct):
     id: Optional[str] = None
     name: Optional[str] = None
     cat: Optional[List[str]] = None
@@ -66,7 +114,7 @@ class Publisher(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Content(BaseModel):
+class Content(ADXStruct):
     id: Optional[str] = None
     episode: Optional[int] = None
     title: Optional[str] = None
@@ -92,7 +140,7 @@ class Content(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Site(BaseModel):
+class Site(ADXStruct):
     id: Optional[str] = None
     name: Optional[str] = None
     domain: Optional[str] = None
@@ -103,7 +151,7 @@ class Site(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class App(BaseModel):
+class App(ADXStruct):
     id: Optional[str] = None
     name: Optional[str] = None
     bundle: Optional[str] = None
@@ -115,7 +163,7 @@ class App(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Geo(BaseModel):
+class Geo(ADXStruct):
     lat: Optional[float] = None
     lon: Optional[float] = None
     type: Optional[int] = None
@@ -132,7 +180,7 @@ class Geo(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Device(BaseModel):
+class Device(ADXStruct):
     ua: Optional[str] = None
     geo: Optional[Geo] = None
     dnt: Optional[int] = None
@@ -164,38 +212,42 @@ class Device(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Segment(BaseModel):
+class Segment(ADXStruct):
     id: Optional[str] = None
     name: Optional[str] = None
     value: Optional[str] = None
     ext: Optional[Dict[str, Any]] = None
 
 
-class Data(BaseModel):
+class Data(ADXStruct):
     id: Optional[str] = None
     name: Optional[str] = None
     segment: Optional[List[Segment]] = None
     ext: Optional[Dict[str, Any]] = None
 
 
-class User(BaseModel):
+class User(ADXStruct):
     id: Optional[str] = None
     buyeruid: Optional[str] = None
     yob: Optional[int] = None
     gender: Optional[str] = None
     keywords: Optional[str] = None
-    data: Optional[List[Data]] = None
+    data: msgspec.Raw = _EMPTY_RAW
     ext: Optional[Dict[str, Any]] = None
 
+    def parsed_data(self) -> List[Data]:
+        """Decode the lazily parsed data segments"""
+        return _parse_lazy(self.data, List[Data], [])
+
 
-class Regulations(BaseModel):
+class Regulations(ADXStruct):
     coppa: Optional[int] = None
     gdpr: Optional[int] = None
     us_privacy: Optional[str] = None
     ext: Optional[Dict[str, Any]] = None
 
 
-class BidRequest(BaseModel):
+class BidRequest(ADXStruct):
     id: str
     imp: List[Impression]
     site: Optional[Site] = None
@@ -211,7 +263,7 @@ class BidRequest(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
-class Bid(BaseModel):
+class Bid(ADXStruct):
     id: str
     impid: str
     price: float
@@ -237,17 +289,21 @@ class Bid(BaseModel):
     wratio: Optional[int] = None
     hratio: Optional[int] = None
     exp: Optional[int] = None
-    ext: Optional[Dict[str, Any]] = None
+    ext: msgspec.Raw = _EMPTY_RAW
+
+    def parsed_ext(self) -> Dict[str, Any]:
+        """Decode the lazily parsed ext object"""
+        return _parse_lazy(self.ext, Dict[str, Any], {})
 
 
-class SeatBid(BaseModel):
+class SeatBid(ADXStruct):
     bid: List[Bid]
     seat: Optional[str] = None
     group: Optional[int] = None
     ext: Optional[Dict[str, Any]] = None
 
 
-class BidResponse(BaseModel):
+class BidResponse(ADXStruct):
     id: str
     seatbid: Optional[List[SeatBid]] = None
     bidid: Optional[str] = None
@@ -257,33 +313,87 @@ class BidResponse(BaseModel):
     ext: Optional[Dict[str, Any]] = None
 
 
+# CTV Specialized Types
+#
+# Narrow OpenRTB subsets for ADXClient.bind_schema(); decoders built for
+# these skip every field a CTV integration never sends.
+
+class CtvImpression(ADXStruct):
+    id: str
+    video: Video
+    bidfloor: Optional[float] = None
+    bidfloorcur: Optional[str] = None
+
+
+class CtvBidRequest(ADXStruct):
+    id: str
+    imp: List[CtvImpression]
+    app: Optional[App] = None
+    device: Optional[Device] = None
+    tmax: Optional[int] = None
+    cur: Optional[List[str]] = None
+
+
+class CtvBid(ADXStruct):
+    id: str
+    impid: str
+    price: float
+    adm: Optional[str] = None
+    nurl: Optional[str] = None
+    crid: Optional[str] = None
+    dealid: Optional[str] = None
+
+
+class CtvSeatBid(ADXStruct):
+    bid: List[CtvBid]
+    seat: Optional[str] = None
+
+
+class CtvBidResponse(ADXStruct):
+    id: str
+    seatbid: Optional[List[CtvSeatBid]] = None
+    cur: Optional[str] = None
+    nbr: Optional[int] = None
+
+
 # SDK Specific Types
 
-class VASTParams(BaseModel):
+class BidTemplate(msgspec.Struct, frozen=True):
+    """
+    Pre-encoded constant portion of a bid request
+
+    Built by ADXClient.precompile_bid_template(); holds the encoded static
+    fields without the closing brace so per-request fields can be spliced
+    in.
+    """
+    prefix: bytes
+
+
+class VASTParams(ADXStruct):
     width: int
     height: int
     duration: int
     extra: Optional[Dict[str, Any]] = None
 
 
-class DailyStat(BaseModel):
+class DailyStat(ADXStruct):
     date: str
     impressions: int
     revenue: str
-    fill_rate: float = Field(alias="fillRate")
+    fill_rate: float = msgspec.field(name="fillRate")
 
 
-class AnalyticsResponse(BaseModel):
-    publisher_id: str = Field(alias="publisherId")
-    total_impressions: int = Field(alias="totalImpressions")
-    total_revenue: str = Field(alias="totalRevenue")
-    fill_rate: float = Field(alias="fillRate")
+class AnalyticsResponse(ADXStruct):
+    publisher_id: str = msgspec.field(name="publisherId")
+    total_impressions: int = msgspec.field(name="totalImpressions")
+    total_revenue: str = msgspec.field(name="totalRevenue")
+    fill_rate: float = msgspec.field(name="fillRate")
     ecpm: str
-    time_range: Dict[str, str] = Field(alias="timeRange")
-    daily_stats: List[DailyStat] = Field(alias="dailyStats")
+    time_range: Dict[str, str] = msgspec.field(name="timeRange")
+    daily_stats: List[DailyStat] = msgspec.field(name="dailyStats")
 
 
-class Location(BaseModel):
+class Location(ADXStruct):
     country: str
     region: str
     city: str
@@ -291,33 +401,34 @@ class Location(BaseModel):
     lon: float
 
 
-class Hardware(BaseModel):
-    cpu_cores: int = Field(alias="cpuCores")
-    memory_gb: int = Field(alias="memoryGb")
-    disk_gb: int = Field(alias="diskGb")
-    network_mbps: int = Field(alias="networkMbps")
+class Hardware(ADXStruct):
+    cpu_cores: int
+    memory_gb: int
+    disk_gb: int
+    network_mbps: int
 
 
-class MinerConfig(BaseModel):
-    wallet_address: str = Field(alias="walletAddress")
-    public_url: str = Field(alias="publicUrl")
-    cache_size: str = Field(alias="cacheSize")
+# Request-side miner types keep snake_case wire names, matching the backend
+class MinerConfig(ADXStruct):
+    wallet_address: str
+    public_url: str
+    cache_size: str
     location: Location
     hardware: Hardware
 
 
-class MinerRegistration(BaseModel):
-    miner_id: str = Field(alias="minerId")
+class MinerRegistration(ADXStruct):
+    miner_id: str = msgspec.field(name="minerId")
     status: str
-    registered_at: str = Field(alias="registeredAt")
-    websocket_url: str = Field(alias="websocketUrl")
+    registered_at: str = msgspec.field(name="registeredAt")
+    websocket_url: str = msgspec.field(name="websocketUrl")
 
 
-class MinerEarnings(BaseModel):
-    miner_id: str = Field(alias="minerId")
-    total_earnings: str = Field(alias="totalEarnings")
-    pending_payout: str = Field(alias="pendingPayout")
-    last_payout: str = Field(alias="lastPayout")
-    total_impressions: int = Field(alias="totalImpressions")
-    total_bandwidth: int = Field(alias="totalBandwidth")
+class MinerEarnings(ADXStruct):
+    miner_id: str = msgspec.field(name="minerId")
+    total_earnings: str = msgspec.field(name="totalEarnings")
+    pending_payout: str = msgspec.field(name="pendingPayout")
+    last_payout: str = msgspec.field(name="lastPayout")
+    total_impressions: int = msgspec.field(name="totalImpressions")
+    total_bandwidth: int = msgspec.field(name="totalBandwidth")
     period: str
\ No newline at end of file
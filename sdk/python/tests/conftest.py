@@ -0,0 +1,90 @@
+"""
+Shared fixtures for ADX SDK tests
+"""
+
+import time
+
+import httpx
+import msgspec
+import pytest
+
+from adx import ADXClient, AsyncADXClient
+from adx.async_client import _RetryTransport
+
+
+class Recorder:
+    """Mock transport handler that records requests"""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []
+        self.bodies = {'/rtb/bid': {'id': 'resp-1'}}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = self.bodies.get(request.url.path, {})
+        if isinstance(body, httpx.AsyncByteStream):
+            return httpx.Response(status, stream=body)
+        if isinstance(body, bytes):
+            return httpx.Response(status, content=body)
+        return httpx.Response(status, json=body)
+
+    def paths(self):
+        return [r.url.path for r in self.requests]
+
+    def batches(self):
+        return [
+            msgspec.json.decode(r.content)
+            for r in self.requests
+            if r.url.path == '/impression/batch'
+        ]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        time.sleep(0.005)
+
+
+def _use_mock_transport(client: AsyncADXClient, recorder: Recorder) -> None:
+    """Swap the client's HTTP transport for a mock, keeping its headers"""
+    client._client = httpx.AsyncClient(
+        headers=client._client.headers,
+        transport=_RetryTransport(httpx.MockTransport(recorder), backoff_factor=0)
+    )
+
+
+@pytest.fixture
+def wait_for():
+    """Poll a predicate until it holds or a timeout expires"""
+    return _wait_for
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def use_mock_transport():
+    return _use_mock_transport
+
+
+@pytest.fixture
+def make_client(recorder):
+    """Factory for sync clients whose HTTP requests go to the recorder"""
+    clients = []
+
+    def factory(base_url='http://adx.test', **kwargs):
+        client = ADXClient(base_url, 'test-key', **kwargs)
+        _use_mock_transport(client._async, recorder)
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        client.close()
@@ -0,0 +1,48 @@
+"""
+Tests for the accelerated viewability aggregation helper
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from adx import ValidationError
+from adx.accel import aggregate_viewability
+
+
+def test_aggregate_viewability():
+    hist, mean = aggregate_viewability([50.0, 70.0, 90.0], [4, 1, 4])
+
+    assert hist.tolist() == [0, 1, 0, 0, 2]
+    assert mean == pytest.approx(70.0)
+
+
+def test_aggregate_viewability_accepts_integral_floats():
+    hist, _ = aggregate_viewability([10.0, 20.0], np.array([0.0, 3.0]))
+
+    assert hist.tolist() == [1, 0, 0, 1, 0]
+
+
+def test_aggregate_viewability_empty():
+    hist, mean = aggregate_viewability([], [])
+
+    assert hist.tolist() == [0, 0, 0, 0, 0]
+    assert mean == 0.0
+
+
+@pytest.mark.parametrize("quarts", [
+    np.array([260], dtype=np.int64),
+    np.array([-1], dtype=np.int64),
+    [5],
+    [1.9],
+    [float('nan')],
+    ['1'],
+])
+def test_aggregate_viewability_rejects_invalid_quartiles(quarts):
+    with pytest.raises(ValidationError):
+        aggregate_viewability([50.0], quarts)
+
+
+def test_aggregate_viewability_rejects_mismatched_lengths():
+    with pytest.raises(ValidationError):
+        aggregate_viewability([50.0, 60.0], [1])
@@ -0,0 +1,65 @@
+"""
+Tests for precompiled bid templates
+"""
+
+import msgspec
+import pytest
+
+from adx import BidRequest, ValidationError
+
+IMP = [{'id': 'imp-1', 'bidfloor': 1.5}]
+
+
+def sent_request(recorder):
+    return msgspec.json.decode(recorder.requests[-1].content)
+
+
+def test_empty_template(make_client, recorder):
+    client = make_client()
+    template = client.precompile_bid_template({})
+    client.bid_request_fast(template, IMP, 'req-1')
+
+    assert template.prefix == b'{'
+    assert sent_request(recorder) == {'id': 'req-1', 'imp': IMP}
+
+
+def test_spliced_body_round_trips(make_client, recorder):
+    client = make_client()
+    static = {'app': {'id': 'app-1'}, 'device': {'ua': 'tv'}, 'tmax': 120}
+    template = client.precompile_bid_template(static)
+    client.bid_request_fast(template, IMP, 'req-1')
+
+    assert sent_request(recorder) == {**static, 'id': 'req-1', 'imp': IMP}
+    request = msgspec.json.decode(recorder.requests[-1].content, type=BidRequest)
+    assert request.tmax == 120
+
+
+def test_request_id_is_escaped(make_client, recorder):
+    client = make_client()
+    template = client.precompile_bid_template({'tmax': 120})
+    request_id = 'a"b\\c\né'
+    client.bid_request_fast(template, IMP, request_id)
+
+    assert sent_request(recorder)['id'] == request_id
+
+
+def test_template_drops_none_values_and_unknown_keys(make_client):
+    client = make_client()
+    template = client.precompile_bid_template(
+        {'site': None, 'app': {'id': 'app-1'}, 'bogus': 1}
+    )
+
+    assert template.prefix == b'{"app":{"id":"app-1"},'
+
+
+@pytest.mark.parametrize('static', [{'id': 'x'}, {'imp': []}])
+def test_template_rejects_id_and_imp(make_client, static):
+    client = make_client()
+    with pytest.raises(ValidationError):
+        client.precompile_bid_template(static)
+
+
+def test_template_schema_errors_raise_sdk_validation_error(make_client):
+    client = make_client()
+    with pytest.raises(ValidationError):
+        client.precompile_bid_template({'tmax': 'soon'})
@@ -0,0 +1,233 @@
+"""
+Tests for the ADX client using a mocked HTTP transport
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import httpx
+import msgspec
+import pytest
+
+from adx import (
+    AsyncADXClient,
+    ADXException,
+    BidResponse,
+    ValidationError,
+    CtvBidRequest,
+    CtvBidResponse,
+)
+
+
+def test_sync_facade_bid_request(make_client, recorder):
+    client = make_client()
+    response = client.bid_request({'id': 'req-1', 'imp': [{'id': 'imp-1'}]})
+
+    assert isinstance(response, BidResponse)
+    assert response.id == 'resp-1'
+    assert recorder.requests[0].headers['X-API-Key'] == 'test-key'
+
+
+def test_report_impression_unbatched_posts_each_event(make_client, recorder):
+    client = make_client()
+    client.report_impression('imp-1', {'price': 1.5})
+
+    assert recorder.paths() == ['/impression/imp-1']
+
+
+def test_batch_flushes_at_128_items(make_client, recorder, wait_for):
+    client = make_client(batch_impressions=True)
+    for i in range(128):
+        client.report_impression(f'imp-{i}', {'n': i})
+    wait_for(lambda: len(recorder.requests) == 1)
+
+    batch = recorder.batches()[0]
+    assert len(batch) == 128
+    assert batch[0] == {'impression_id': 'imp-0', 'data': {'n': 0}}
+
+    # The pending timer finds an empty buffer and sends nothing
+    time.sleep(0.1)
+    assert len(recorder.requests) == 1
+
+
+def test_batch_flushes_after_interval(make_client, recorder, wait_for):
+    client = make_client(batch_impressions=True)
+    for i in range(3):
+        client.report_impression(f'imp-{i}', {'n': i})
+    assert recorder.requests == []
+
+    wait_for(lambda: len(recorder.requests) == 1)
+    assert [len(b) for b in recorder.batches()] == [3]
+
+
+def test_close_flushes_buffered_impressions(make_client, recorder):
+    client = make_client(batch_impressions=True)
+    client.report_impression('imp-1', {'n': 1})
+    client.report_impression('imp-2', {'n': 2})
+    client.close()
+
+    assert [len(b) for b in recorder.batches()] == [2]
+
+
+def test_flush_impressions_raises_on_failure(make_client, recorder):
+    recorder.statuses = [400]
+    client = make_client(batch_impressions=True)
+    client.report_impression('imp-1', {'n': 1})
+    with pytest.raises(ADXException):
+        client.flush_impressions()
+
+
+def test_retries_transient_503(make_client, recorder):
+    recorder.statuses = [503, 503]
+    client = make_client()
+    client.report_impression('imp-1', {})
+
+    assert len(recorder.requests) == 3
+
+
+def test_retries_give_up_after_three(make_client, recorder):
+    recorder.statuses = [503] * 10
+    client = make_client()
+    with pytest.raises(ADXException, match='HTTP 503'):
+        client.report_impression('imp-1', {})
+
+    assert len(recorder.requests) == 4
+
+
+def test_does_not_retry_client_errors(make_client, recorder):
+    recorder.statuses = [429]
+    client = make_client()
+    with pytest.raises(ADXException):
+        client.report_impression('imp-1', {})
+
+    assert len(recorder.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_report_impressions_batch(recorder, use_mock_transport):
+    async with AsyncADXClient('http://adx.test', 'test-key') as client:
+        use_mock_transport(client, recorder)
+        await client.report_impressions_batch([('imp-1', {'n': 1})])
+
+    assert recorder.batches() == [[{'impression_id': 'imp-1', 'data': {'n': 1}}]]
+
+
+ANALYTICS_BODY = {
+    'publisherId': 'pub-1',
+    'totalImpressions': 10,
+    'totalRevenue': '1.00',
+    'fillRate': 0.5,
+    'ecpm': '0.10',
+    'timeRange': {'start': 'a', 'end': 'b'},
+    'dailyStats': [
+        {'date': 'd', 'impressions': 10, 'revenue': '1.00', 'fillRate': 0.5}
+    ]
+}
+
+
+def test_analytics_cache_hits_return_independent_copies(make_client, recorder):
+    recorder.bodies['/analytics'] = ANALYTICS_BODY
+    client = make_client()
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 8)
+
+    first = client.get_analytics('pub-1', start, end)
+    first.daily_stats.clear()
+    second = client.get_analytics('pub-1', start, end)
+
+    assert len(recorder.requests) == 1
+    assert len(second.daily_stats) == 1
+    assert second is not first
+
+
+def test_bound_schema_sends_unmodelled_fields(make_client, recorder):
+    client = make_client()
+    request = {
+        'id': 'req-1',
+        'imp': [{'id': 'imp-1', 'video': {'mimes': ['video/mp4']}, 'secure': 1}],
+        'site': {'id': 'site-1'},
+        'user': {'id': 'user-1'},
+        'regs': {'coppa': 0},
+    }
+    client.bind_schema(CtvBidRequest, CtvBidResponse)
+    response = client.bid_request(request)
+
+    assert isinstance(response, CtvBidResponse)
+    assert msgspec.json.decode(recorder.requests[0].content) == request
+
+
+def test_bound_schema_still_validates(make_client, recorder):
+    client = make_client()
+    client.bind_schema(CtvBidRequest, CtvBidResponse)
+    with pytest.raises(ValidationError):
+        client.bid_request({'id': 'req-1', 'imp': [{'id': 'imp-1'}]})
+
+    assert recorder.requests == []
+
+
+def test_bid_request_drops_none_values_and_unknown_keys(make_client, recorder):
+    client = make_client()
+    client.bid_request({
+        'id': 'req-1',
+        'imp': [{'id': 'imp-1', 'banner': None, 'ext': {'a': 1}}],
+        'site': None,
+        'bogus': 1,
+    })
+
+    assert msgspec.json.decode(recorder.requests[0].content) == {
+        'id': 'req-1',
+        'imp': [{'id': 'imp-1', 'ext': {'a': 1}}],
+    }
+
+
+def test_bid_request_raises_sdk_validation_error(make_client, recorder):
+    client = make_client()
+    with pytest.raises(ValidationError):
+        client.bid_request({'id': 'req-1', 'imp': [{'id': 1}]})
+
+    assert recorder.requests == []
+
+
+@pytest.mark.asyncio
+async def test_map_caps_concurrency(use_mock_transport):
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return httpx.Response(200, json={})
+
+    async with AsyncADXClient('http://adx.test', 'test-key') as client:
+        use_mock_transport(client, handler)
+        results = await client.map(
+            'report_impression',
+            [(f'imp-{i}', {}) for i in range(20)],
+            concurrency=4
+        )
+
+    assert results == [None] * 20
+    assert len(peak) == 20
+    assert max(peak) == 4
+
+
+@pytest.mark.parametrize('method', [
+    'invalidate_analytics',
+    'nonexistent',
+    '_send_bid',
+    'get_vast_stream',
+])
+def test_map_rejects_non_request_methods(make_client, recorder, method):
+    client = make_client()
+    with pytest.raises(ValidationError):
+        client.map(method, [('imp-1', {})])
+
+    assert recorder.requests == []
+
+
+def test_map_rejects_zero_concurrency(make_client):
+    client = make_client()
+    with pytest.raises(ValidationError):
+        client.map('report_impression', [('imp-1', {})], concurrency=0)
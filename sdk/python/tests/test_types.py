@@ -0,0 +1,49 @@
+"""
+Tests for lazily parsed (Raw) struct fields
+"""
+
+import msgspec
+
+from adx import Banner, BidRequest, Impression, User
+from adx.types import Data
+
+
+def test_python_constructed_values_are_accepted():
+    imp = Impression(id='1', ext={'a': 1})
+    banner = Banner(format=[{'w': 300, 'h': 250}])
+    user = User(data=[{'id': 'd1'}])
+
+    assert imp.parsed_ext() == {'a': 1}
+    assert banner.parsed_format() == [{'w': 300, 'h': 250}]
+    assert user.parsed_data() == [Data(id='d1')]
+    assert msgspec.json.decode(msgspec.json.encode(imp)) == {'id': '1', 'ext': {'a': 1}}
+    assert imp.as_dict() == {'id': '1', 'ext': {'a': 1}}
+
+
+def test_raw_values_are_kept_as_is():
+    raw = msgspec.Raw(b'{"a":1}')
+    imp = Impression(id='1', ext=raw)
+
+    assert imp.ext is raw
+    assert imp.parsed_ext() == {'a': 1}
+
+
+def test_unset_fields_parse_to_empty():
+    assert Impression(id='1').parsed_ext() == {}
+    assert Banner().parsed_format() == []
+    assert User().parsed_data() == []
+
+
+def test_null_parses_to_empty():
+    body = b'{"id":"r","imp":[{"id":"1","ext":null,"banner":{"format":null}}]}'
+    imp = msgspec.json.decode(body, type=BidRequest).imp[0]
+
+    assert imp.parsed_ext() == {}
+    assert imp.banner.parsed_format() == []
+    assert User(data=None).parsed_data() == []
+
+
+def test_as_dict_expands_raw_fields():
+    imp = msgspec.json.decode(b'{"id":"1","ext":{"a":1}}', type=Impression)
+
+    assert imp.as_dict() == {'id': '1', 'ext': {'a': 1}}
@@ -0,0 +1,73 @@
+"""
+Tests for streaming VAST creatives through the sync facade
+"""
+
+import httpx
+import pytest
+
+from adx import AuthenticationError, ValidationError, VASTParams
+
+PARAMS = VASTParams(width=640, height=480, duration=30)
+
+
+class ChunkStream(httpx.AsyncByteStream):
+    """Response body that yields fixed chunks and records when it is closed"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_stream_yields_whole_body_in_chunks(make_client, recorder):
+    body = b'<VAST>' + b'x' * 20000 + b'</VAST>'
+    recorder.bodies['/vast'] = body
+    client = make_client()
+
+    chunks = list(client.get_vast_stream(PARAMS, chunk_size=8192))
+
+    assert b''.join(chunks) == body
+    assert [len(c) for c in chunks] == [8192, 8192, len(body) - 16384]
+    assert recorder.requests[0].url.params['w'] == '640'
+
+
+def test_closing_stream_early_releases_response(make_client, recorder):
+    stream = ChunkStream([b'<VAST>', b'<Ad/>', b'</VAST>'])
+    recorder.bodies['/vast'] = stream
+    client = make_client()
+
+    chunks = client.get_vast_stream(PARAMS, chunk_size=6)
+    assert next(chunks) == b'<VAST>'
+    chunks.close()
+
+    assert stream.closed
+    assert stream.sent == 1
+
+    # The client is still usable afterwards
+    recorder.bodies['/vast'] = b'<VAST/>'
+    assert client.get_vast(PARAMS) == '<VAST/>'
+
+
+@pytest.mark.parametrize('status, error', [
+    (400, ValidationError),
+    (401, AuthenticationError),
+])
+def test_stream_error_maps_to_sdk_exception(make_client, recorder, status, error):
+    recorder.statuses = [status]
+    recorder.bodies['/vast'] = b'bad params'
+    client = make_client()
+
+    with pytest.raises(error) as excinfo:
+        list(client.get_vast_stream(PARAMS))
+
+    if status == 400:
+        # The error body is read before the stream is torn down
+        assert 'bad params' in str(excinfo.value)
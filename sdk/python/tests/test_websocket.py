@@ -0,0 +1,131 @@
+"""
+Tests for WebSocket event dispatch against a local server
+"""
+
+import asyncio
+import threading
+
+import msgspec
+import pytest
+from websockets.asyncio.server import serve
+
+from adx import ADXException
+
+
+class FrameServer:
+    """Local WebSocket server that sends a fixed list of frames per connection"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.connections = 0
+        self.port = None
+        self._ready = threading.Event()
+        self._stop = None
+        self._loop = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        self._ready.wait(5)
+        return self
+
+    def __exit__(self, *exc):
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join(5)
+
+    async def _handler(self, ws):
+        self.connections += 1
+        for frame in self.frames:
+            await ws.send(frame)
+        await ws.wait_closed()
+
+    def _run(self):
+        async def main():
+            self._loop = asyncio.get_running_loop()
+            self._stop = self._loop.create_future()
+            async with serve(self._handler, '127.0.0.1', 0) as server:
+                self.port = server.sockets[0].getsockname()[1]
+                self._ready.set()
+                await self._stop
+
+        asyncio.run(main())
+
+
+def event(event_type, data):
+    return msgspec.json.encode({'type': event_type, 'data': data}).decode()
+
+
+@pytest.fixture
+def ws_client(make_client):
+    """Factory for sync clients pointed at a local FrameServer"""
+    def factory(server):
+        return make_client(f'http://127.0.0.1:{server.port}')
+
+    return factory
+
+
+def test_sync_handler_can_call_client(ws_client, recorder, wait_for):
+    with FrameServer([event('bid', {'id': 'imp-1'})]) as server:
+        client = ws_client(server)
+        client.on('bid', lambda d: client.report_impression(d['id'], {}))
+        client.connect_websocket()
+
+        wait_for(lambda: recorder.paths() == ['/impression/imp-1'])
+
+        # The event loop is still responsive afterwards
+        client.report_impression('imp-2', {})
+        assert recorder.paths() == ['/impression/imp-1', '/impression/imp-2']
+
+
+def test_run_from_loop_thread_raises(ws_client, wait_for):
+    errors = []
+
+    async def handler(data):
+        try:
+            client.report_impression('imp-1', {})
+        except ADXException as e:
+            errors.append(e)
+
+    with FrameServer([event('bid', {})]) as server:
+        client = ws_client(server)
+        client.on('bid', handler)
+        client.connect_websocket()
+
+        wait_for(lambda: len(errors) == 1)
+        assert 'event loop thread' in str(errors[0])
+
+
+def test_async_callable_object_handler_runs(ws_client, wait_for):
+    received = []
+
+    class Handler:
+        async def __call__(self, data):
+            received.append((data, asyncio.get_running_loop()))
+
+    with FrameServer([event('bid', {'n': 1})]) as server:
+        client = ws_client(server)
+        client.on('bid', Handler())
+        client.connect_websocket()
+
+        wait_for(lambda: len(received) == 1)
+        assert received[0][0] == {'n': 1}
+        assert received[0][1] is client._loop
+
+
+def test_malformed_frames_do_not_drop_connection(ws_client, wait_for):
+    received = []
+    frames = [
+        'not json',
+        '[1, 2]',
+        '{"type": ["unhashable"], "data": 1}',
+        '{"data": 1}',
+        event('bid', {'n': 1}),
+    ]
+
+    with FrameServer(frames) as server:
+        client = ws_client(server)
+        client.on('bid', received.append)
+        client.connect_websocket()
+
+        wait_for(lambda: received == [{'n': 1}])
+        assert server.connections == 1